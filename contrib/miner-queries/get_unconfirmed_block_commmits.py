@@ -11,6 +11,13 @@ python3 get_unconfirmed_block_commits.py [btcAddress1] [btcAddress2] ...
 import requests
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Upper bound on concurrent requests made to the mempool API.
+MAX_WORKERS = 8
+
+# Shared HTTP session so connections to the API are reused across requests.
+session = requests.Session()
 
 def read_api_endpoint(url):
     """
@@ -23,10 +30,10 @@ def read_api_endpoint(url):
         dict: JSON response from the API if successful, otherwise None.
     """
     try:
-        response = requests.get(url)
+        response = session.get(url)
         response.raise_for_status()  # Raise an exception for non-200 status codes
         return response.json()  # Assuming a JSON response
-    except requests.exceptions.RequestException as e:
+    except requests.exceptions.RequestException:
         return None
 
 def is_block_commit(txn):
@@ -69,10 +76,12 @@ def unconfirmed_block_commit_from_address(btcAddress):
         btcAddress (str): Bitcoin address.
 
     Returns:
-        dict: The first transaction that is a block commit.
+        dict: The first transaction that is a block commit, or None if there is none.
     """
     url = MEMPOOL_TXN_API.format(btcAddress=btcAddress)
     txns = read_api_endpoint(url)
+    if not txns:
+        return None
 
     # Return only the first block commit transaction. This is good enough for now.
     for txn in txns:
@@ -90,23 +99,23 @@ def extracted_block_commit_data(txn):
         dict: Extracted data from the transaction, or None if extraction fails.
     """
     try:
-        vout_start = 1
-        vout_end = len(txn['vout']) - 1
+        pox_payouts = txn['vout'][1:-1]
         spent_utxo = txn['vin'][0]
         return {
             'txid': txn['txid'],
-            'burn': sum(pox_payout['value'] for pox_payout in txn['vout'][vout_start:vout_end]),
+            'burn': sum(pox_payout['value'] for pox_payout in pox_payouts),
             'address': spent_utxo['prevout']['scriptpubkey_address'],
-            'pox_addrs': [txn['vout'][i]['scriptpubkey'] for i in range(vout_start,vout_end)],
+            'pox_addrs': [pox_payout['scriptpubkey'] for pox_payout in pox_payouts],
             'input_txid': spent_utxo['txid'],
             'input_index': spent_utxo['vout'],
         }
-    except Exception as e:
+    except Exception:
         return None
 
 def block_commit_data(btcAddresses):
     """
     Fetches and extracts block commit data for a list of Bitcoin addresses.
+    Addresses are queried concurrently; results keep the input order.
 
     Args:
         btcAddresses (list): List of Bitcoin addresses.
@@ -114,8 +123,9 @@ def block_commit_data(btcAddresses):
     Returns:
         list: Extracted block commit data for each address.
     """
-    return [extracted_block_commit_data(unconfirmed_block_commit_from_address(btcAddress)) \
-            for btcAddress in btcAddresses]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        txns = executor.map(unconfirmed_block_commit_from_address, btcAddresses)
+        return [extracted_block_commit_data(txn) for txn in txns]
 
 def main():
     """
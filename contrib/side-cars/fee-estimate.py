@@ -10,6 +10,7 @@ Args:
     polling_delay_seconds (int): The frequency in seconds to check for fee updates.
 """
 
+import os
 import toml
 import json
 import requests
@@ -17,6 +18,10 @@ import time
 from backoff_utils import strategies
 from backoff_utils import apply_backoff
 from sys import argv
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared HTTP session so connections to the APIs are reused between polls.
+session = requests.Session()
 
 # Fee estimation API URLS and their corresponding fee extraction functions.
 # At least one of these needs to be working in order for the script to function.
@@ -40,6 +45,26 @@ FEE_ESTIMATIONS = [
     ),
 ]
 
+def fetch_fee_estimate(fee_estimation):
+    """
+    Fetches a single fee estimate from one API endpoint.
+
+    Args:
+        fee_estimation (tuple): The URL of an API endpoint and a function
+        that extracts the fee estimate from its JSON response.
+
+    Returns:
+        int: The fee estimate in sat/Byte, or None if the API failed.
+    """
+
+    api_url, unpack_fee_estimate = fee_estimation
+    try:
+        json_response = json.loads(get_from_api(api_url))
+        return unpack_fee_estimate(json_response)
+
+    except Exception:
+        return None
+
 def calculate_fee_estimate():
     """
     Calculates the mean fee estimate from a list of API URLs
@@ -54,20 +79,19 @@ def calculate_fee_estimate():
         int: The mean fee estimate in sat/Byte.
 
     Raises:
-        None
+        RuntimeError: If none of the APIs returned a fee estimate.
     """
 
-    # Gather all API estimated fees in sat/Byte
-    estimated_fees = []
-    for api_url, unpack_fee_estimate in FEE_ESTIMATIONS:
-
-        try:
-            json_response = json.loads(get_from_api(api_url))
-            estimated_fee = unpack_fee_estimate(json_response)
-            estimated_fees.append(estimated_fee)
+    # Gather all API estimated fees in sat/Byte, querying the APIs concurrently
+    with ThreadPoolExecutor(max_workers=len(FEE_ESTIMATIONS)) as executor:
+        estimated_fees = [
+            estimated_fee
+            for estimated_fee in executor.map(fetch_fee_estimate, FEE_ESTIMATIONS)
+            if estimated_fee is not None
+        ]
 
-        except Exception as e:
-            pass
+    if not estimated_fees:
+        raise RuntimeError("No fee estimation API returned a fee estimate.")
 
     # Calculate the mean fee estimate
     mean_fee = int(sum(estimated_fees) / len(estimated_fees))
@@ -96,14 +120,14 @@ def get_from_api(api_url: str) -> str:
 
     try:
         # Make a GET request to the API endpoint
-        response = requests.get(api_url)
+        response = session.get(api_url)
 
         # Check if the request was successful
         if response.status_code == 200:
             # Parse the response and return the data
             return response.text
 
-    except Exception as e:
+    except Exception:
         # If an exception occurs, raise a RuntimeError
         raise RuntimeError("Failed to unpack JSON.")
 
@@ -111,6 +135,15 @@ def get_from_api(api_url: str) -> str:
     raise RuntimeError("Failed to get response.")
 
 
+def toml_file_key(stat_result: os.stat_result) -> tuple:
+    """
+    Returns the key used to detect changes to the TOML file between polls.
+
+    The size is included alongside the modification time because some
+    filesystems only record timestamps to the nearest second or two.
+    """
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
 def update_config_fee(toml_file_location: str, polling_delay_seconds: int):
     """
     Updates the `satoshis_per_byte` value in the specified TOML file
@@ -124,20 +157,26 @@ def update_config_fee(toml_file_location: str, polling_delay_seconds: int):
         RuntimeError: If the fee estimation process fails.
     """
 
+    toml_data = None
+    toml_key = None
+
     while True:
         # Calculate mean fee estimate from the list of APIs
         fee_estimate = calculate_fee_estimate()
 
-        # Read toml file data
-        with open(toml_file_location, 'r') as toml_file:
-            toml_data = toml.load(toml_file)
+        # Read toml file data, unless it is unchanged since the last read or write
+        if toml_file_key(os.stat(toml_file_location)) != toml_key:
+            with open(toml_file_location, 'r') as toml_file:
+                toml_key = toml_file_key(os.fstat(toml_file.fileno()))
+                toml_data = toml.load(toml_file)
 
-        # Update satoshis_per_byte data
-        toml_data["burnchain"]["satoshis_per_byte"] = fee_estimate
-
-        # Update toml file with configuration changes
-        with open(toml_file_location, 'w') as toml_file:
-            toml.dump(toml_data, toml_file)
+        # Update toml file with configuration changes, if the fee changed
+        if toml_data["burnchain"].get("satoshis_per_byte") != fee_estimate:
+            toml_data["burnchain"]["satoshis_per_byte"] = fee_estimate
+            with open(toml_file_location, 'w') as toml_file:
+                toml.dump(toml_data, toml_file)
+                toml_file.flush()
+                toml_key = toml_file_key(os.fstat(toml_file.fileno()))
 
         time.sleep(polling_delay_seconds)
 
@@ -158,8 +197,6 @@ def main():
     """
 
     try:
-        configuration = {}
-
         if len(argv) == 1:
             configuration = read_config("./config/fee-estimate.json")
         elif "-c" in argv:
@@ -178,9 +215,9 @@ def main():
     # Print usage if there are errors.
     except Exception as e:
         print(f"Failed to run {argv[0]}")
-        print(f"\n\t$ COMMAND /path/to/miner.toml polling_delay_seconds")
+        print("\n\t$ COMMAND /path/to/miner.toml polling_delay_seconds")
         print("\t\tOR")
-        print(f"\t$ COMMAND -c /path/to/config_file.json\n")
+        print("\t$ COMMAND -c /path/to/config_file.json\n")
         print(f"Error: {e}")
 
 # Execute main.
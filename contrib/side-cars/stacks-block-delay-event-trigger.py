@@ -49,7 +49,6 @@ Example:
 ```
 """
 
-import toml
 import json
 import requests
 import time
@@ -67,6 +66,9 @@ API_URL_LATEST_STACKS_TRANSACTION = "https://api.mainnet.hiro.so/extended/v1/tx/
 API_URL_LATEST_BTC_BLOCK_HASH = "https://mempool.space/api/blocks/tip/hash"
 API_URL_BTC_BLOCK_FROM_HASH = "https://mempool.space/api/block/{block_hash}"
 
+# Shared HTTP session so connections to the APIs are reused between polls.
+session = requests.Session()
+
 @apply_backoff(
     strategy=strategies.Exponential,
     catch_exceptions=(RuntimeError,),
@@ -89,14 +91,14 @@ def get_from_api(api_url: str) -> dict:
 
     try:
         # Make a GET request to the API endpoint
-        response = requests.get(api_url)
+        response = session.get(api_url)
 
         # Check if the request was successful
         if response.status_code == 200:
             # Parse the response and return the data
             return response.text
 
-    except Exception as e:
+    except Exception:
         # If an exception occurs, raise a RuntimeError
         raise RuntimeError("Failed to unpack JSON.")
 
@@ -193,8 +195,6 @@ def main():
     """
 
     try:
-        configuration = {}
-
         if len(argv) == 1:
             configuration = read_config("./config/stacks-block-delay-event-trigger.json")
         elif "-c" in argv:
@@ -216,9 +216,9 @@ def main():
     # Print usage if there are errors.
     except Exception as e:
         print(f"Failed to run {argv[0]}")
-        print(f"\n\t$ COMMAND polling_delay_seconds max_stacks_delay_seconds recovery_delay_seconds shell_command...")
+        print("\n\t$ COMMAND polling_delay_seconds max_stacks_delay_seconds recovery_delay_seconds shell_command...")
         print("\t\tOR")
-        print(f"\t$ COMMAND -c /path/to/config_file.json\n")
+        print("\t$ COMMAND -c /path/to/config_file.json\n")
         print(f"Error: {e}")
 
 # Execute main.